@@ -2,51 +2,64 @@ import streamlit as st
 import numpy as np
 import pandas as pd
 
-# Corrected Ticket Sales Model
-def calculate_tickets_sold(event_rating, production_spending, arena_size):
-    """Corrected model for tickets sold."""
-    intercept = 1216.66
-    coef_event_rating = 22.31
-    coef_production_values = -0.00014
-    coef_arena_size = -0.04
-    tickets_sold = coef_event_rating * event_rating + coef_production_values * production_spending + coef_arena_size * arena_size + intercept
-    return max(0, min(arena_size, tickets_sold))  # Cap at arena size
-
-# Refined models for spending
-def calculate_ad_spending(event_rating):
-    """Non-linear model for ad spending."""
-    return 1_745_787.68 * np.log(0.00125 * event_rating + 1) + 2_452.16
-
-def calculate_production_spending(per_seat_spending, arena_size):
-    """Capped linear model for production spending."""
-    capped_per_seat = min(per_seat_spending, 4.37)
-    return capped_per_seat * arena_size
-
-def calculate_merchandising_revenue(tickets_sold, average_merch_spending=15):
-    """Estimate merchandising revenue."""
-    return tickets_sold * average_merch_spending
-
-def calculate_food_drink_revenue(tickets_sold, average_food_spending=20):
-    """Estimate food & drink revenue."""
-    return tickets_sold * average_food_spending
-
-def calculate_ppv_purchases(event_rating, ad_spending, ppv_length_hours):
-    """Refined PPV purchases model with scaling for event length."""
-    intercept = 157501.78
-    coef_event_rating = 1420.70
-    coef_ad_spending = -0.90
-    # Non-linear scaling for length (e.g., diminishing returns)
-    length_multiplier = 1 + (0.2 * ppv_length_hours) - (0.05 * ppv_length_hours**2)
-    base_purchases = max(0, coef_event_rating * event_rating + coef_ad_spending * ad_spending + intercept)
-    return base_purchases * max(0, length_multiplier)  # Ensure multiplier is non-negative
-
-def calculate_ppv_revenue(ppv_purchases):
-    """Calculate gross PPV revenue."""
-    return ppv_purchases * 35  # $35 per PPV purchase
-
-def calculate_ppv_profit(ppv_revenue):
-    """Calculate the profit contribution from PPV revenue (50% only)."""
-    return ppv_revenue * 0.5  # Only 50% contributes to profits
+import spending_model as model
+
+# Parameter sweep for sensitivity analysis
+@st.cache_data(max_entries=64)
+def sweep(event_ratings, arena_sizes, ppv_length_hours, commentators_cost, cameras_cost):
+    """Profit over a grid of event ratings (rows) and arena sizes (columns)."""
+    ratings = np.asarray(event_ratings, dtype=np.float64)
+    arenas = np.asarray(arena_sizes, dtype=np.float64)
+    return model.sweep_profit(ratings, arenas, ppv_length_hours) - (commentators_cost + cameras_cost)
+
+# Full model for one set of inputs
+@st.cache_data(max_entries=1024)
+def compute_all(event_rating, arena_size, ppv_length_hours, commentators_cost, cameras_cost):
+    """Evaluate every displayed revenue, cost and profit figure in one pass."""
+    ad_spending = model.calculate_ad_spending(event_rating)
+    prod_spending = model.PER_SEAT_PRODUCTION * arena_size
+    tickets_sold = max(0, min(arena_size, model.TICKETS_COEF_EVENT_RATING * event_rating + model.TICKETS_COEF_PRODUCTION * prod_spending + model.TICKETS_COEF_ARENA_SIZE * arena_size + model.TICKETS_INTERCEPT))
+    if ppv_length_hours == 0:
+        ppv_purchases = 0
+    else:
+        ppv_purchases = max(0, model.PPV_COEF_EVENT_RATING * event_rating + model.PPV_COEF_AD_SPENDING * ad_spending + model.PPV_INTERCEPT) * model.ppv_length_multiplier(ppv_length_hours)
+    ppv_revenue = ppv_purchases * model.PPV_PRICE
+    ppv_profit = ppv_revenue * model.PPV_PROFIT_SHARE
+    ticket_revenue = tickets_sold * model.TICKET_PRICE
+    merchandising_revenue = tickets_sold * model.MERCH_PER_TICKET
+    food_drink_revenue = tickets_sold * model.FOOD_PER_TICKET
+    total_costs = ad_spending + prod_spending + commentators_cost + cameras_cost
+    return {
+        "tickets_sold": tickets_sold,
+        "ticket_revenue": ticket_revenue,
+        "merchandising_revenue": merchandising_revenue,
+        "food_drink_revenue": food_drink_revenue,
+        "ppv_purchases": ppv_purchases,
+        "ppv_revenue": ppv_revenue,
+        "ppv_profit": ppv_profit,
+        "total_revenue": ticket_revenue + merchandising_revenue + food_drink_revenue + ppv_revenue,
+        "recommended_ad_spending": ad_spending,
+        "recommended_prod_spending": prod_spending,
+        "total_costs": total_costs,
+        "profit": ticket_revenue + merchandising_revenue + food_drink_revenue + ppv_profit - total_costs,
+    }
+
+# Chart data, indexed by category for st.bar_chart
+@st.cache_data(max_entries=1024)
+def _revenue_frame(tickets, merchandising, food_drink, ppv):
+    """Revenue amounts per category."""
+    return pd.DataFrame(
+        {"Amount": [tickets, merchandising, food_drink, ppv]},
+        index=pd.Index(["Tickets", "Merchandising", "Food & Drink", "PPV"], name="Category"),
+    )
+
+@st.cache_data(max_entries=1024)
+def _cost_frame(ad_spending, production_spending, commentators, cameras):
+    """Cost amounts per category."""
+    return pd.DataFrame(
+        {"Amount": [ad_spending, production_spending, commentators, cameras]},
+        index=pd.Index(["Ad Spending", "Production Spending", "Commentators", "Cameras"], name="Category"),
+    )
 
 # Streamlit app
 st.title("Event Spending Optimization Tool (With Adjusted PPV Profit)")
@@ -62,64 +75,43 @@ ad_budget = st.number_input("Ad Budget (Optional)", min_value=0, value=0)
 prod_budget = st.number_input("Production Budget (Optional)", min_value=0, value=0)
 
 # Calculations
-recommended_ad_spending = calculate_ad_spending(event_rating)
-recommended_prod_spending = calculate_production_spending(4.37, arena_size)
-
-tickets_sold = calculate_tickets_sold(event_rating, recommended_prod_spending, arena_size)
-ticket_revenue = tickets_sold * 75  # Assume $75 average ticket price
-merchandising_revenue = calculate_merchandising_revenue(tickets_sold)
-food_drink_revenue = calculate_food_drink_revenue(tickets_sold)
-
-# Handle PPV Revenue
-if ppv_length_hours == 0:
-    ppv_purchases = 0
-    ppv_revenue = 0
-    ppv_profit = 0
-else:
-    ppv_purchases = calculate_ppv_purchases(event_rating, recommended_ad_spending, ppv_length_hours)
-    ppv_revenue = calculate_ppv_revenue(ppv_purchases)
-    ppv_profit = calculate_ppv_profit(ppv_revenue)
-
-# Total Revenue and Costs
-total_revenue = ticket_revenue + merchandising_revenue + food_drink_revenue + ppv_revenue
-total_costs = recommended_ad_spending + recommended_prod_spending + commentators_cost + cameras_cost
-profit = (ticket_revenue + merchandising_revenue + food_drink_revenue + ppv_profit) - total_costs
+results = compute_all(event_rating, arena_size, ppv_length_hours, commentators_cost, cameras_cost)
 
 # Outputs
 st.header("Revenue Breakdown")
-st.write(f"**Tickets Sold:** {tickets_sold:,.0f}")
-st.write(f"**Ticket Revenue:** ${ticket_revenue:,.2f}")
-st.write(f"**Merchandising Revenue:** ${merchandising_revenue:,.2f}")
-st.write(f"**Food & Drink Revenue:** ${food_drink_revenue:,.2f}")
-st.write(f"**PPV Purchases:** {ppv_purchases:,.0f}")
-st.write(f"**PPV Revenue (Gross):** ${ppv_revenue:,.2f}")
-st.write(f"**PPV Profit Contribution:** ${ppv_profit:,.2f}")
-st.write(f"**Total Revenue:** ${total_revenue:,.2f}")
+st.write(f"**Tickets Sold:** {results['tickets_sold']:,.0f}")
+st.write(f"**Ticket Revenue:** ${results['ticket_revenue']:,.2f}")
+st.write(f"**Merchandising Revenue:** ${results['merchandising_revenue']:,.2f}")
+st.write(f"**Food & Drink Revenue:** ${results['food_drink_revenue']:,.2f}")
+st.write(f"**PPV Purchases:** {results['ppv_purchases']:,.0f}")
+st.write(f"**PPV Revenue (Gross):** ${results['ppv_revenue']:,.2f}")
+st.write(f"**PPV Profit Contribution:** ${results['ppv_profit']:,.2f}")
+st.write(f"**Total Revenue:** ${results['total_revenue']:,.2f}")
 
 st.header("Cost Breakdown")
-st.write(f"**Ad Spending:** ${recommended_ad_spending:,.2f}")
-st.write(f"**Production Spending:** ${recommended_prod_spending:,.2f}")
+st.write(f"**Ad Spending:** ${results['recommended_ad_spending']:,.2f}")
+st.write(f"**Production Spending:** ${results['recommended_prod_spending']:,.2f}")
 st.write(f"**Commentators Cost:** ${commentators_cost:,.2f}")
 st.write(f"**Cameras Cost:** ${cameras_cost:,.2f}")
-st.write(f"**Total Costs:** ${total_costs:,.2f}")
+st.write(f"**Total Costs:** ${results['total_costs']:,.2f}")
 
 st.header("Profit Calculation")
-st.write(f"**Profit:** ${profit:,.2f}")
+st.write(f"**Profit:** ${results['profit']:,.2f}")
 
 # Create DataFrames for Visualization
-revenue_data = pd.DataFrame({
-    "Category": ["Tickets", "Merchandising", "Food & Drink", "PPV"],
-    "Amount": [ticket_revenue, merchandising_revenue, food_drink_revenue, ppv_profit]
-})
-
-cost_data = pd.DataFrame({
-    "Category": ["Ad Spending", "Production Spending", "Commentators", "Cameras"],
-    "Amount": [recommended_ad_spending, recommended_prod_spending, commentators_cost, cameras_cost]
-})
+revenue_data = _revenue_frame(results["ticket_revenue"], results["merchandising_revenue"], results["food_drink_revenue"], results["ppv_profit"])
+cost_data = _cost_frame(results["recommended_ad_spending"], results["recommended_prod_spending"], commentators_cost, cameras_cost)
 
 # Visualization
 st.header("Revenue Breakdown Chart")
-st.bar_chart(revenue_data.set_index("Category"))
+st.bar_chart(revenue_data)
 
 st.header("Cost Breakdown Chart")
-st.bar_chart(cost_data.set_index("Category"))
+st.bar_chart(cost_data)
+
+# Optional, since the sweep is far more work than the single-point model
+if st.checkbox("Show Profit Sensitivity Chart"):
+    st.header("Profit Sensitivity Chart")
+    sweep_ratings = np.arange(1001)
+    profit_curve = sweep(sweep_ratings, [arena_size], ppv_length_hours, commentators_cost, cameras_cost)[:, 0]
+    st.line_chart(pd.DataFrame({"Profit": profit_curve}, index=pd.Index(sweep_ratings, name="Event Rating")))